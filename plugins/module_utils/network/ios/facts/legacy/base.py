@@ -19,6 +19,13 @@ __metaclass__ = type
 import platform
 import re
 
+try:
+    import re2
+
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.ios import (
     run_commands,
     get_capabilities,
@@ -26,8 +33,133 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.ios import (
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.ios import (
     normalize_interface,
 )
-from ansible.module_utils.six import iteritems
-from ansible.module_utils.six.moves import zip
+
+# The interpreter version cannot change for the life of the process, so
+# resolve it once at import instead of on every facts gather.
+_PY_VERSION = platform.python_version()
+
+# Substrings that mark a command as unsupported or a feature as disabled
+# on the target device.
+_VSS_ERRS = ("Invalid input", "Switch Mode : Standalone")
+_LLDP_ERRS = ("Invalid input", "LLDP is not enabled")
+_CDP_ERRS = ("CDP is not enabled",)
+
+# Patterns are compiled once at module load so the parse_* methods do not
+# pay the `re` cache lookup on every invocation during a facts gather.
+_RE_STACK_MODEL = re.compile(r"^Model [Nn]umber\s+: (\S+)", re.M)
+_RE_STACK_SERIALNUM = re.compile(
+    r"^System [Ss]erial [Nn]umber\s+: (\S+)", re.M
+)
+_RE_VSS_DOMAIN = re.compile(r"^Virtual switch domain number : ([0-9]+)", re.M)
+
+_RE_DIR_OF = re.compile(r"^Directory of (\S+)/", re.M)
+_RE_FS_INFO = re.compile(
+    r"^(?:Directory of (?P<fs>\S+)/"
+    r"|(?P<total>\d+) bytes total \((?P<free>\d+) bytes free\))",
+    re.M,
+)
+_RE_PROC_LINE = re.compile(r"^.*Processor.*$", re.M)
+_RE_PROC_MEM = re.compile(r"\s(\d+)\s")
+
+_RE_BUILDING_CFG = re.compile(
+    r"\ABuilding configuration\.\.\.\s+Current configuration : \d+ bytes\n"
+)
+
+_RE_DESCRIPTION = re.compile(r"Description: (.+)$", re.M)
+_RE_MACADDRESS = re.compile(r"Hardware is (?:.*), address is (\S+)")
+_RE_INET = re.compile(r"Internet address is (\S+)")
+_RE_IPV4_ADDRESS = re.compile(
+    r"(?:Internet address is (?P<primary>[^/\s]+)/(?P<primary_subnet>\S+)"
+    r"|Secondary address (?P<secondary>[^/\s]+)/(?P<secondary_subnet>\S+))",
+    re.M,
+)
+_RE_IPV6 = re.compile(
+    r"\s+(?P<addr>\S[^,\n]*?)\s*, subnet is\s*(?P<subnet>[^\n]+?)\s*$",
+    re.M,
+)
+_RE_DUPLEX = re.compile(r"(\w+) Duplex", re.M)
+_RE_MEDIATYPE = re.compile(r"media type is (.+)$", re.M)
+_RE_TYPE = re.compile(r"Hardware is (.+),", re.M)
+_RE_LINEPROTOCOL = re.compile(r"line protocol is (\S+)\s*$", re.M)
+_RE_OPERSTATUS = re.compile(r"^(?:.+) is (.+),", re.M)
+
+# Single-pass alternation over one `show interfaces` block. Each named
+# group maps to the fact key of the same name, so populate_interfaces can
+# collect every field in one scan of the block instead of running a
+# separate search per field.
+_RE_INTERFACE_PATTERN = (
+    r"^(?:\S+) is (?P<operstatus>[^,\n]+),"
+    r"|line protocol is (?P<lineprotocol>\S+)\s*$"
+    r"|Hardware is (?P<type>[^,\n]+),(?: address is (?P<macaddress>\S+))?"
+    r"|Description: (?P<description>.+)$"
+    r"|MTU (?P<mtu>\d+)"
+    r"|BW (?P<bandwidth>\d+)"
+    r"|(?P<duplex>\w+) Duplex"
+    r"|media type is (?P<mediatype>.+)$"
+)
+
+# The pattern has no backreferences or lookarounds, so when the optional
+# google-re2 binding is installed the hot interface scan can run on its
+# linear-time DFA engine; otherwise the stdlib engine is used. re2's
+# compile() does not take re flags, so multiline is set inline, and any
+# compile failure falls back to the stdlib engine.
+_RE_INTERFACE = None
+if HAS_RE2:
+    try:
+        _RE_INTERFACE = re2.compile("(?m)" + _RE_INTERFACE_PATTERN)
+    except Exception:
+        _RE_INTERFACE = None
+if _RE_INTERFACE is None:
+    _RE_INTERFACE = re.compile(_RE_INTERFACE_PATTERN, re.M)
+
+_RE_LLDP_INTF = re.compile(r"^Local Intf: (.+)$", re.M)
+_RE_LLDP_HOST = re.compile(r"System Name: (.+)$", re.M)
+_RE_LLDP_PORT = re.compile(r"Port id: (.+)$", re.M)
+_RE_CDP_INTF_PORT = re.compile(
+    r"^Interface: (.+),  Port ID \(outgoing port\): (.+)$", re.M
+)
+_RE_CDP_HOST = re.compile(r"^Device ID: (.+)$", re.M)
+_RE_CDP_PLATFORM = re.compile(r"^Platform: (.+),", re.M)
+
+# Entry separators in the neighbor detail outputs: a 48-dash rule for
+# LLDP and a 25-dash rule for CDP.
+_RE_LLDP_SEP = re.compile(r"-{48,}")
+_RE_CDP_SEP = re.compile(r"-{25,}")
+
+# Fused per-entry scans for the neighbor detail outputs, mirroring
+# _RE_INTERFACE: one finditer pass per entry instead of a separate
+# search per field.
+_RE_LLDP_ENTRY = re.compile(
+    r"^Local Intf: (?P<intf>.+)$"
+    r"|System Name: (?P<host>.+)$"
+    r"|Port id: (?P<port>.+)$",
+    re.M,
+)
+_RE_CDP_ENTRY = re.compile(
+    r"^Device ID: (?P<host>.+)$"
+    r"|^Platform: (?P<platform>[^,\n]+),"
+    r"|^Interface: (?P<intf>.+),  Port ID \(outgoing port\): (?P<port>.+)$",
+    re.M,
+)
+
+
+def _contains_any(data, needles):
+    """Return True if any of the needle substrings occurs in data."""
+    return any(needle in data for needle in needles)
+
+
+def _iter_entries(data, separator):
+    """Lazily yield the text between separator matches.
+
+    Unlike str.split this does not materialize the full list of entries
+    up front; each slice is produced only when the caller consumes it.
+    """
+    start = 0
+    for match in separator.finditer(data):
+        stop = match.start()
+        yield data[start:stop]
+        start = match.end()
+    yield data[start:]
 
 
 class FactsBase(object):
@@ -62,30 +194,26 @@ class Default(FactsBase):
             self.facts["serialnum"] = self.parse_serialnum(data)
             self.parse_stacks(data)
         data = self.responses[1]
-        vss_errs = ["Invalid input", "Switch Mode : Standalone"]
-        if data and not any(err in data for err in vss_errs):
+        if data and not _contains_any(data, _VSS_ERRS):
             self.parse_virtual_switch(data)
 
     def parse_iostype(self, data):
-        match = re.search(r"\sIOS-XE\s", data)
-        if match:
+        if " IOS-XE " in data:
             return "IOS-XE"
         else:
             return "IOS"
 
     def parse_serialnum(self, data):
-        match = re.search(r"board ID (\S+)", data)
-        if match:
-            return match.group(1)
+        tokens = data.partition("board ID ")[2].split(None, 1)
+        if tokens:
+            return tokens[0]
 
     def parse_stacks(self, data):
-        match = re.findall(r"^Model [Nn]umber\s+: (\S+)", data, re.M)
+        match = _RE_STACK_MODEL.findall(data)
         if match:
             self.facts["stacked_models"] = match
 
-        match = re.findall(
-            r"^System [Ss]erial [Nn]umber\s+: (\S+)", data, re.M
-        )
+        match = _RE_STACK_SERIALNUM.findall(data)
         if match:
             self.facts["stacked_serialnums"] = match
 
@@ -93,14 +221,15 @@ class Default(FactsBase):
             self.facts["virtual_switch"] = "STACK"
 
     def parse_virtual_switch(self, data):
-        match = re.search(
-            r"^Virtual switch domain number : ([0-9]+)", data, re.M
-        )
+        match = _RE_VSS_DOMAIN.search(data)
         if match:
             self.facts["virtual_switch"] = "VSS"
             self.facts["virtual_switch_domain"] = match.group(1)
 
     def platform_facts(self):
+        # get_capabilities caches its response on the module
+        # (module._ios_capabilities), so only the first caller in a
+        # gather run pays the device round-trip.
         platform_facts = {}
 
         resp = get_capabilities(self.module)
@@ -114,7 +243,7 @@ class Default(FactsBase):
                 platform_facts[item] = val
 
         platform_facts["api"] = resp["network_api"]
-        platform_facts["python_version"] = platform.python_version()
+        platform_facts["python_version"] = _PY_VERSION
 
         return platform_facts
 
@@ -136,30 +265,26 @@ class Hardware(FactsBase):
             if "Invalid input detected" in data:
                 warnings.append("Unable to gather memory statistics")
             else:
-                processor_line = [
-                    l for l in data.splitlines() if "Processor" in l
-                ].pop()
-                match = re.findall(r"\s(\d+)\s", processor_line)
+                processor_line = _RE_PROC_LINE.findall(data).pop()
+                match = _RE_PROC_MEM.findall(processor_line)
                 if match:
-                    self.facts["memtotal_mb"] = int(match[0]) / 1024
-                    self.facts["memfree_mb"] = int(match[3]) / 1024
+                    self.facts["memtotal_mb"] = int(match[0]) // 1024
+                    self.facts["memfree_mb"] = int(match[3]) // 1024
 
     def parse_filesystems(self, data):
-        return re.findall(r"^Directory of (\S+)/", data, re.M)
+        return _RE_DIR_OF.findall(data)
 
     def parse_filesystems_info(self, data):
         facts = dict()
         fs = ""
-        for line in data.split("\n"):
-            match = re.match(r"^Directory of (\S+)/", line)
-            if match:
-                fs = match.group(1)
+        for match in _RE_FS_INFO.finditer(data):
+            group = match.groupdict()
+            if group["fs"]:
+                fs = group["fs"]
                 facts[fs] = dict()
-                continue
-            match = re.match(r"^(\d+) bytes total \((\d+) bytes free\)", line)
-            if match:
-                facts[fs]["spacetotal_kb"] = int(match.group(1)) / 1024
-                facts[fs]["spacefree_kb"] = int(match.group(2)) / 1024
+            else:
+                facts[fs]["spacetotal_kb"] = int(group["total"]) // 1024
+                facts[fs]["spacefree_kb"] = int(group["free"]) // 1024
         return facts
 
 
@@ -171,12 +296,13 @@ class Config(FactsBase):
         super(Config, self).populate()
         data = self.responses[0]
         if data:
-            data = re.sub(
-                r"^Building configuration...\s+Current configuration : \d+ bytes\n",
-                "",
-                data,
-                flags=re.MULTILINE,
-            )
+            # The preamble only ever appears at the very start of the
+            # response; an anchored match plus a slice avoids re.sub
+            # scanning and copying the entire running-config.
+            match = _RE_BUILDING_CFG.match(data)
+            if match:
+                end = match.end()
+                data = data[end:]
             self.facts["config"] = data
 
 
@@ -213,9 +339,7 @@ class Interfaces(FactsBase):
             self.populate_ipv6_interfaces(data)
 
         data = self.responses[3]
-        lldp_errs = ["Invalid input", "LLDP is not enabled"]
-
-        if data and not any(err in data for err in lldp_errs):
+        if data and not _contains_any(data, _LLDP_ERRS):
             neighbors = self.run(["show lldp neighbors detail"])
             if neighbors:
                 self.facts["neighbors"].update(
@@ -223,9 +347,7 @@ class Interfaces(FactsBase):
                 )
 
         data = self.responses[4]
-        cdp_errs = ["CDP is not enabled"]
-
-        if data and not any(err in data for err in cdp_errs):
+        if data and not _contains_any(data, _CDP_ERRS):
             cdp_neighbors = self.run(["show cdp neighbors detail"])
             if cdp_neighbors:
                 self.facts["neighbors"].update(
@@ -234,51 +356,65 @@ class Interfaces(FactsBase):
 
     def populate_interfaces(self, interfaces):
         facts = dict()
-        for key, value in iteritems(interfaces):
-            intf = dict()
-            intf["description"] = self.parse_description(value)
-            intf["macaddress"] = self.parse_macaddress(value)
-
-            intf["mtu"] = self.parse_mtu(value)
-            intf["bandwidth"] = self.parse_bandwidth(value)
-            intf["mediatype"] = self.parse_mediatype(value)
-            intf["duplex"] = self.parse_duplex(value)
-            intf["lineprotocol"] = self.parse_lineprotocol(value)
-            intf["operstatus"] = self.parse_operstatus(value)
-            intf["type"] = self.parse_type(value)
-
+        for key, value in interfaces.items():
+            intf = dict.fromkeys(
+                (
+                    "description",
+                    "macaddress",
+                    "mtu",
+                    "bandwidth",
+                    "mediatype",
+                    "duplex",
+                    "lineprotocol",
+                    "operstatus",
+                    "type",
+                )
+            )
+            for match in _RE_INTERFACE.finditer(value):
+                for field, field_value in match.groupdict().items():
+                    if field_value is None or intf[field] is not None:
+                        continue
+                    if field in ("mtu", "bandwidth"):
+                        field_value = int(field_value)
+                    intf[field] = field_value
             facts[key] = intf
         return facts
 
     def populate_ipv4_interfaces(self, data):
         for key, value in data.items():
             self.facts["interfaces"][key]["ipv4"] = list()
-            primary_address = addresses = []
-            primary_address = re.findall(
-                r"Internet address is (.+)$", value, re.M
-            )
-            addresses = re.findall(r"Secondary address (.+)$", value, re.M)
-            if len(primary_address) == 0:
+            primary_address = None
+            addresses = list()
+            for match in _RE_IPV4_ADDRESS.finditer(value):
+                if match.group("primary"):
+                    if primary_address is None:
+                        primary_address = match.group(
+                            "primary", "primary_subnet"
+                        )
+                else:
+                    addresses.append(
+                        match.group("secondary", "secondary_subnet")
+                    )
+            if primary_address is None:
                 continue
-            addresses.append(primary_address[0])
-            for address in addresses:
-                addr, subnet = address.split("/")
-                ipv4 = dict(address=addr.strip(), subnet=subnet.strip())
-                self.add_ip_address(addr.strip(), "ipv4")
+            addresses.append(primary_address)
+            for addr, subnet in addresses:
+                ipv4 = dict(address=addr, subnet=subnet)
+                self.add_ip_address(addr, "ipv4")
                 self.facts["interfaces"][key]["ipv4"].append(ipv4)
 
     def populate_ipv6_interfaces(self, data):
-        for key, value in iteritems(data):
+        for key, value in data.items():
             try:
                 self.facts["interfaces"][key]["ipv6"] = list()
             except KeyError:
                 self.facts["interfaces"][key] = dict()
                 self.facts["interfaces"][key]["ipv6"] = list()
-            addresses = re.findall(r"\s+(.+), subnet", value, re.M)
-            subnets = re.findall(r", subnet is (.+)$", value, re.M)
-            for addr, subnet in zip(addresses, subnets):
-                ipv6 = dict(address=addr.strip(), subnet=subnet.strip())
-                self.add_ip_address(addr.strip(), "ipv6")
+            for match in _RE_IPV6.finditer(value):
+                addr = match.group("addr")
+                subnet = match.group("subnet")
+                ipv6 = dict(address=addr, subnet=subnet)
+                self.add_ip_address(addr, "ipv6")
                 self.facts["interfaces"][key]["ipv6"].append(ipv6)
 
     def add_ip_address(self, address, family):
@@ -289,135 +425,143 @@ class Interfaces(FactsBase):
 
     def parse_neighbors(self, neighbors):
         facts = dict()
-        for entry in neighbors.split(
-            "------------------------------------------------"
-        ):
+        for entry in _iter_entries(neighbors, _RE_LLDP_SEP):
             if entry == "":
                 continue
-            intf = self.parse_lldp_intf(entry)
+            entry_facts = dict()
+            for match in _RE_LLDP_ENTRY.finditer(entry):
+                for field, value in match.groupdict().items():
+                    if value is not None and entry_facts.get(field) is None:
+                        entry_facts[field] = value
+            intf = entry_facts.get("intf")
             if intf is None:
                 return facts
             intf = normalize_interface(intf)
             if intf not in facts:
                 facts[intf] = list()
             fact = dict()
-            fact["host"] = self.parse_lldp_host(entry)
-            fact["port"] = self.parse_lldp_port(entry)
+            fact["host"] = entry_facts.get("host")
+            fact["port"] = entry_facts.get("port")
             facts[intf].append(fact)
         return facts
 
     def parse_cdp_neighbors(self, neighbors):
         facts = dict()
-        for entry in neighbors.split("-------------------------"):
+        for entry in _iter_entries(neighbors, _RE_CDP_SEP):
             if entry == "":
                 continue
-            intf_port = self.parse_cdp_intf_port(entry)
-            if intf_port is None:
+            entry_facts = dict()
+            for match in _RE_CDP_ENTRY.finditer(entry):
+                for field, value in match.groupdict().items():
+                    if value is not None and entry_facts.get(field) is None:
+                        entry_facts[field] = value
+            intf = entry_facts.get("intf")
+            if intf is None:
                 return facts
-            intf, port = intf_port
             if intf not in facts:
                 facts[intf] = list()
             fact = dict()
-            fact["host"] = self.parse_cdp_host(entry)
-            fact["platform"] = self.parse_cdp_platform(entry)
-            fact["port"] = port
+            fact["host"] = entry_facts.get("host")
+            fact["platform"] = entry_facts.get("platform")
+            fact["port"] = entry_facts.get("port")
             facts[intf].append(fact)
         return facts
 
     def parse_interfaces(self, data):
-        parsed = dict()
+        # Accumulate each interface block as a list of lines and join once
+        # at the end; repeated string concatenation is quadratic in the
+        # size of the block.
+        buffers = dict()
         key = ""
         for line in data.split("\n"):
             if len(line) == 0:
                 continue
-            if line[0] == " ":
-                parsed[key] += "\n%s" % line
+            if line.startswith((" ", "\t")):
+                buffers[key].append(line)
             else:
-                match = re.match(r"^(\S+)", line)
-                if match:
-                    key = match.group(1)
-                    parsed[key] = line
-        return parsed
+                first = line.split(None, 1)
+                if first:
+                    key = first[0]
+                    buffers[key] = [line]
+        return dict((key, "\n".join(lines)) for key, lines in buffers.items())
 
     def parse_description(self, data):
-        match = re.search(r"Description: (.+)$", data, re.M)
+        match = _RE_DESCRIPTION.search(data)
         if match:
             return match.group(1)
 
     def parse_macaddress(self, data):
-        match = re.search(r"Hardware is (?:.*), address is (\S+)", data)
+        match = _RE_MACADDRESS.search(data)
         if match:
             return match.group(1)
 
     def parse_ipv4(self, data):
-        match = re.search(r"Internet address is (\S+)", data)
+        match = _RE_INET.search(data)
         if match:
             addr, masklen = match.group(1).split("/")
             return dict(address=addr, masklen=int(masklen))
 
     def parse_mtu(self, data):
-        match = re.search(r"MTU (\d+)", data)
-        if match:
-            return int(match.group(1))
+        token = data.partition("MTU ")[2].split(None, 1)
+        if token and token[0].isdigit():
+            return int(token[0])
 
     def parse_bandwidth(self, data):
-        match = re.search(r"BW (\d+)", data)
-        if match:
-            return int(match.group(1))
+        token = data.partition("BW ")[2].split(None, 1)
+        if token and token[0].isdigit():
+            return int(token[0])
 
     def parse_duplex(self, data):
-        match = re.search(r"(\w+) Duplex", data, re.M)
+        match = _RE_DUPLEX.search(data)
         if match:
             return match.group(1)
 
     def parse_mediatype(self, data):
-        match = re.search(r"media type is (.+)$", data, re.M)
+        match = _RE_MEDIATYPE.search(data)
         if match:
             return match.group(1)
 
     def parse_type(self, data):
-        match = re.search(r"Hardware is (.+),", data, re.M)
+        match = _RE_TYPE.search(data)
         if match:
             return match.group(1)
 
     def parse_lineprotocol(self, data):
-        match = re.search(r"line protocol is (\S+)\s*$", data, re.M)
+        match = _RE_LINEPROTOCOL.search(data)
         if match:
             return match.group(1)
 
     def parse_operstatus(self, data):
-        match = re.search(r"^(?:.+) is (.+),", data, re.M)
+        match = _RE_OPERSTATUS.search(data)
         if match:
             return match.group(1)
 
     def parse_lldp_intf(self, data):
-        match = re.search(r"^Local Intf: (.+)$", data, re.M)
+        match = _RE_LLDP_INTF.search(data)
         if match:
             return match.group(1)
 
     def parse_lldp_host(self, data):
-        match = re.search(r"System Name: (.+)$", data, re.M)
+        match = _RE_LLDP_HOST.search(data)
         if match:
             return match.group(1)
 
     def parse_lldp_port(self, data):
-        match = re.search(r"Port id: (.+)$", data, re.M)
+        match = _RE_LLDP_PORT.search(data)
         if match:
             return match.group(1)
 
     def parse_cdp_intf_port(self, data):
-        match = re.search(
-            r"^Interface: (.+),  Port ID \(outgoing port\): (.+)$", data, re.M
-        )
+        match = _RE_CDP_INTF_PORT.search(data)
         if match:
             return match.group(1), match.group(2)
 
     def parse_cdp_host(self, data):
-        match = re.search(r"^Device ID: (.+)$", data, re.M)
+        match = _RE_CDP_HOST.search(data)
         if match:
             return match.group(1)
 
     def parse_cdp_platform(self, data):
-        match = re.search(r"^Platform: (.+),", data, re.M)
+        match = _RE_CDP_PLATFORM.search(data)
         if match:
             return match.group(1)